@@ -40,6 +40,23 @@ class AdhocToolRunnableField(StringField):
     )
 
 
+class AdhocToolWorkdirField(StringField):
+    alias: ClassVar[str] = "workdir"
+    default = "."
+    help = help_text(
+        """
+        Sets the working directory for the process.
+
+        Values are relative to the build root, except in the following cases:
+
+        * `.` specifies the location of the `BUILD` file.
+        * Values beginning with `./` are relative to the location of the `BUILD` file.
+        * `/` or the empty string specifies the build root.
+        * Values beginning with `/` are also relative to the build root.
+        """
+    )
+
+
 class AdhocToolOutputFilesField(StringSequenceField):
     alias: ClassVar[str] = "output_files"
     required = False
@@ -64,13 +81,12 @@ class AdhocToolOutputDirectoriesField(StringSequenceField):
     required = False
     default = ()
     help = help_text(
-        lambda: f"""
+        f"""
         Specify full directories (including recursive descendants) of output to capture, relative
         to the value of `{AdhocToolWorkdirField.alias}`.
 
         For individual files, use `{AdhocToolOutputFilesField.alias}`. At least one of
-        `{AdhocToolOutputFilesField.alias}` and`{AdhocToolOutputDirectoriesField.alias}` must be
-        specified.
+        `{AdhocToolOutputFilesField.alias}` and`{alias}` must be specified.
 
         Relative paths (including `..`) may be used, as long as the path does not ascend further
         than the build root.
@@ -123,7 +139,7 @@ class AdhocToolRunnableDependenciesField(SpecialCasedDependencies):
     default = None
 
     help = help_text(
-        lambda: f"""
+        f"""
         The runnable dependencies for this command.
 
         Dependencies specified here are those required to exist on the `PATH` to make the command
@@ -146,16 +162,14 @@ class AdhocToolSourcesField(MultipleSourcesField):
 class AdhocToolArgumentsField(StringSequenceField):
     alias: ClassVar[str] = "args"
     default = ()
-    help = help_text(
-        lambda: f"Extra arguments to pass into the `{AdhocToolRunnableField.alias}` field."
-    )
+    help = help_text(f"Extra arguments to pass into the `{AdhocToolRunnableField.alias}` field.")
 
 
 class AdhocToolStdoutFilenameField(StringField):
     alias: ClassVar[str] = "stdout"
     default = None
     help = help_text(
-        lambda: f"""
+        f"""
         A filename to capture the contents of `stdout` to. Relative paths are
         relative to the value of `{AdhocToolWorkdirField.alias}`, absolute paths
         start at the build root.
@@ -167,7 +181,7 @@ class AdhocToolStderrFilenameField(StringField):
     alias: ClassVar[str] = "stderr"
     default = None
     help = help_text(
-        lambda: f"""
+        f"""
         A filename to capture the contents of `stderr` to. Relative paths are
         relative to the value of `{AdhocToolWorkdirField.alias}`, absolute paths
         start at the build root.
@@ -200,23 +214,6 @@ class AdhocToolLogOutputField(BoolField):
     help = "Set to true if you want the output logged to the console."
 
 
-class AdhocToolWorkdirField(StringField):
-    alias: ClassVar[str] = "workdir"
-    default = "."
-    help = help_text(
-        """
-        Sets the working directory for the process.
-
-        Values are relative to the build root, except in the following cases:
-
-        * `.` specifies the location of the `BUILD` file.
-        * Values beginning with `./` are relative to the location of the `BUILD` file.
-        * `/` or the empty string specifies the build root.
-        * Values beginning with `/` are also relative to the build root.
-        """
-    )
-
-
 class AdhocToolNamedCachesField(DictStringToStringField):
     alias = "experimental_named_caches"
     help = help_text(
@@ -297,12 +294,12 @@ class AdhocToolTarget(Target):
         EnvironmentField,
     )
     help = help_text(
-        lambda: f"""
+        f"""
         Execute any runnable target for its side effects.
 
         Example BUILD file:
 
-            {AdhocToolTarget.alias}(
+            {alias}(
                 {AdhocToolRunnableField.alias}=":python_source",
                 {AdhocToolArgumentsField.alias}=[""],
                 {AdhocToolExecutionDependenciesField.alias}=[":scripts"],
@@ -379,7 +376,7 @@ class SystemBinaryTarget(Target):
         SystemBinaryFingerprintDependenciesField,
     )
     help = help_text(
-        lambda: f"""
+        f"""
         A system binary that can be run with `pants run` or consumed by `{AdhocToolTarget.alias}`.
 
         Pants will search for binaries with name `{SystemBinaryNameField.alias}` in the search
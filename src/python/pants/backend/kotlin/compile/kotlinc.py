@@ -2,7 +2,6 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
-import itertools
 import logging
 
 from pants.backend.java.target_types import JavaFieldSet, JavaGeneratorFieldSet
@@ -17,6 +16,7 @@ from pants.backend.kotlin.subsystems.kotlinc import KotlincSubsystem
 from pants.backend.kotlin.target_types import (
     KotlinFieldSet,
     KotlinGeneratorFieldSet,
+    KotlinGeneratorSourcesField,
     KotlinSourceField,
 )
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
@@ -26,7 +26,6 @@ from pants.engine.process import FallibleProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
 from pants.engine.unions import UnionRule
-from pants.jvm.classpath import Classpath
 from pants.jvm.compile import (
     ClasspathDependenciesRequest,
     ClasspathEntry,
@@ -41,15 +40,40 @@ from pants.jvm.resolve.common import ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized
 
 logger = logging.getLogger(__name__)
 
+_TOOLCP_RELPATH = "__toolcp"
+_LOCAL_KOTLINC_PLUGINS_RELPATH = "__localplugincp"
+_USERCP_RELPATH = "__cp"
+_KOTLINC_MAIN_CLASS = "org.jetbrains.kotlin.cli.jvm.K2JVMCompiler"
+_EXTRA_NAILGUN_KEYS = (_TOOLCP_RELPATH, _LOCAL_KOTLINC_PLUGINS_RELPATH)
+
 
 class CompileKotlinSourceRequest(ClasspathEntryRequest):
     field_sets = (KotlinFieldSet, KotlinGeneratorFieldSet)
     field_sets_consume_only = (JavaFieldSet, JavaGeneratorFieldSet)
 
 
+@memoized
+def _kotlinc_tool_requirements(kotlin_version: str) -> ArtifactRequirements:
+    return ArtifactRequirements.from_coordinates(
+        [
+            Coordinate(
+                group="org.jetbrains.kotlin",
+                artifact="kotlin-compiler-embeddable",
+                version=kotlin_version,
+            ),
+            Coordinate(
+                group="org.jetbrains.kotlin",
+                artifact="kotlin-scripting-compiler-embeddable",
+                version=kotlin_version,
+            ),
+        ]
+    )
+
+
 def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
     return f"{ctgt.representative.address.path_safe_spec}.kotlin.jar"
 
@@ -60,13 +84,15 @@ async def compile_kotlin_source(
     kotlinc: KotlincSubsystem,
     request: CompileKotlinSourceRequest,
 ) -> FallibleClasspathEntry:
+    description = str(request.component)
+
     # Request classpath entries for our direct dependencies.
     dependency_cpers = await Get(FallibleClasspathEntries, ClasspathDependenciesRequest(request))
     direct_dependency_classpath_entries = dependency_cpers.if_all_succeeded()
 
     if direct_dependency_classpath_entries is None:
         return FallibleClasspathEntry(
-            description=str(request.component),
+            description=description,
             result=CompileResult.DEPENDENCY_FAILED,
             output=None,
             exit_code=1,
@@ -74,125 +100,111 @@ async def compile_kotlin_source(
 
     kotlin_version = kotlin.version_for_resolve(request.resolve.name)
 
+    # NB: Kotlin target generators never hydrate to `KotlinSourceField`s, so there is no need to
+    # request their sources.
     component_members_with_sources = tuple(
-        t for t in request.component.members if t.has_field(SourcesField)
-    )
-    component_members_and_source_files = zip(
-        component_members_with_sources,
-        await MultiGet(
-            Get(
-                SourceFiles,
-                SourceFilesRequest(
-                    (t.get(SourcesField),),
-                    for_sources_types=(KotlinSourceField,),
-                    enable_codegen=True,
-                ),
-            )
-            for t in component_members_with_sources
-        ),
+        t
+        for t in request.component.members
+        if t.has_field(SourcesField) and not t.has_field(KotlinGeneratorSourcesField)
     )
-
-    plugins_ = await MultiGet(
-        Get(
-            KotlincPluginTargetsForTarget,
-            KotlincPluginsForTargetRequest(target, request.resolve.name),
+    kotlin_sources_digests: list[Digest] = []
+    seen_digests: set[Digest] = set()
+    kotlin_source_files: list[str] = []
+    plugins_: tuple[KotlincPluginTargetsForTarget, ...] = ()
+    if component_members_with_sources:
+        # NB: Source files and plugin targets are independent, so they are requested together.
+        component_members_source_files, plugins_ = await MultiGet(
+            MultiGet(
+                Get(
+                    SourceFiles,
+                    SourceFilesRequest(
+                        (t.get(SourcesField),),
+                        for_sources_types=(KotlinSourceField,),
+                        enable_codegen=True,
+                    ),
+                )
+                for t in component_members_with_sources
+            ),
+            MultiGet(
+                Get(
+                    KotlincPluginTargetsForTarget,
+                    KotlincPluginsForTargetRequest(target, request.resolve.name),
+                )
+                for target in request.component.members
+            ),
         )
-        for target in request.component.members
-    )
-    plugins_request = KotlincPluginsRequest.from_target_plugins(plugins_, request.resolve)
-    local_plugins = await Get(KotlincPlugins, KotlincPluginsRequest, plugins_request)
-
-    component_members_and_kotlin_source_files = [
-        (target, sources)
-        for target, sources in component_members_and_source_files
-        if sources.snapshot.digest != EMPTY_DIGEST
-    ]
-
-    if not component_members_and_kotlin_source_files:
+        for sources in component_members_source_files:
+            digest = sources.snapshot.digest
+            # NB: Codegen may produce identical sources for more than one member, which only need
+            # to be merged and passed to the compiler once.
+            if digest != EMPTY_DIGEST and digest not in seen_digests:
+                seen_digests.add(digest)
+                kotlin_sources_digests.append(digest)
+                kotlin_source_files.extend(sources.snapshot.files)
+
+    if not kotlin_sources_digests:
         # Is a generator, and so exports all of its direct deps.
         exported_digest = await Get(
             Digest, MergeDigests(cpe.digest for cpe in direct_dependency_classpath_entries)
         )
         classpath_entry = ClasspathEntry.merge(exported_digest, direct_dependency_classpath_entries)
         return FallibleClasspathEntry(
-            description=str(request.component),
+            description=description,
             result=CompileResult.SUCCEEDED,
             output=classpath_entry,
             exit_code=0,
         )
 
-    toolcp_relpath = "__toolcp"
-    local_kotlinc_plugins_relpath = "__localplugincp"
-    usercp = "__cp"
-
-    user_classpath = Classpath(direct_dependency_classpath_entries, request.resolve)
-
-    tool_classpath, sources_digest, jdk = await MultiGet(
+    plugins_request = KotlincPluginsRequest.from_target_plugins(plugins_, request.resolve)
+    local_plugins, tool_classpath, sources_digest, jdk = await MultiGet(
+        Get(KotlincPlugins, KotlincPluginsRequest, plugins_request),
         Get(
             ToolClasspath,
-            ToolClasspathRequest(
-                artifact_requirements=ArtifactRequirements.from_coordinates(
-                    [
-                        Coordinate(
-                            group="org.jetbrains.kotlin",
-                            artifact="kotlin-compiler-embeddable",
-                            version=kotlin_version,
-                        ),
-                        Coordinate(
-                            group="org.jetbrains.kotlin",
-                            artifact="kotlin-scripting-compiler-embeddable",
-                            version=kotlin_version,
-                        ),
-                    ]
-                ),
-            ),
-        ),
-        Get(
-            Digest,
-            MergeDigests(
-                (
-                    sources.snapshot.digest
-                    for _, sources in component_members_and_kotlin_source_files
-                )
-            ),
+            ToolClasspathRequest(artifact_requirements=_kotlinc_tool_requirements(kotlin_version)),
         ),
+        Get(Digest, MergeDigests(kotlin_sources_digests)),
         Get(JdkEnvironment, JdkRequest, JdkRequest.from_target(request.component)),
     )
 
     extra_immutable_input_digests = {
-        toolcp_relpath: tool_classpath.digest,
-        local_kotlinc_plugins_relpath: local_plugins.classpath.digest,
+        _TOOLCP_RELPATH: tool_classpath.digest,
+        _LOCAL_KOTLINC_PLUGINS_RELPATH: local_plugins.classpath.digest,
     }
-    extra_nailgun_keys = tuple(extra_immutable_input_digests)
-    extra_immutable_input_digests.update(user_classpath.immutable_inputs(prefix=usercp))
-
-    classpath_arg = ":".join(user_classpath.immutable_inputs_args(prefix=usercp))
+    classpath_arg = ""
+    if direct_dependency_classpath_entries:
+        # NB: The transitive closure of the user classpath is walked once here and shared between
+        # the immutable inputs and their args, rather than being recomputed by each `Classpath`
+        # method.
+        user_classpath_entries = tuple(ClasspathEntry.closure(direct_dependency_classpath_entries))
+        extra_immutable_input_digests.update(
+            ClasspathEntry.immutable_inputs(user_classpath_entries, prefix=_USERCP_RELPATH)
+        )
+        classpath_arg = ":".join(
+            ClasspathEntry.immutable_inputs_args(user_classpath_entries, prefix=_USERCP_RELPATH)
+        )
 
     output_file = compute_output_jar_filename(request.component)
+
+    argv = [_KOTLINC_MAIN_CLASS]
+    if classpath_arg:
+        argv.extend(("-classpath", classpath_arg))
+    argv.extend(("-d", output_file))
+    argv.extend(local_plugins.args(_LOCAL_KOTLINC_PLUGINS_RELPATH))
+    argv.extend(kotlinc.args)
+    kotlin_source_files.sort()
+    argv.extend(kotlin_source_files)
+
     process_result = await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
-            classpath_entries=tool_classpath.classpath_entries(toolcp_relpath),
-            argv=[
-                "org.jetbrains.kotlin.cli.jvm.K2JVMCompiler",
-                *(("-classpath", classpath_arg) if classpath_arg else ()),
-                "-d",
-                output_file,
-                *(local_plugins.args(local_kotlinc_plugins_relpath)),
-                *kotlinc.args,
-                *sorted(
-                    itertools.chain.from_iterable(
-                        sources.snapshot.files
-                        for _, sources in component_members_and_kotlin_source_files
-                    )
-                ),
-            ],
+            classpath_entries=tool_classpath.classpath_entries(_TOOLCP_RELPATH),
+            argv=argv,
             input_digest=sources_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
-            extra_nailgun_keys=extra_nailgun_keys,
+            extra_nailgun_keys=_EXTRA_NAILGUN_KEYS,
             output_files=(output_file,),
-            description=f"Compile {request.component} with kotlinc",
+            description=f"Compile {description} with kotlinc",
             level=LogLevel.DEBUG,
         ),
     )
@@ -205,7 +217,7 @@ async def compile_kotlin_source(
         )
 
     return FallibleClasspathEntry.from_fallible_process_result(
-        str(request.component),
+        description,
         process_result,
         output,
     )
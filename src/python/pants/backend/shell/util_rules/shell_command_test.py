@@ -27,12 +27,16 @@ from pants.core.goals.run import RunRequest
 from pants.core.target_types import ArchiveTarget, FilesGeneratorTarget, FileSourceField
 from pants.core.target_types import rules as core_target_type_rules
 from pants.core.util_rules import archive, source_files
-from pants.core.util_rules.adhoc_process_support import AdhocProcessRequest
+from pants.core.util_rules.adhoc_process_support import (
+    AddExtraSandboxContentsToProcess,
+    AdhocProcessRequest,
+    ExtraSandboxContents,
+)
 from pants.core.util_rules.environments import LocalWorkspaceEnvironmentTarget
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import EMPTY_SNAPSHOT, DigestContents
+from pants.engine.fs import EMPTY_DIGEST, EMPTY_SNAPSHOT, DigestContents
 from pants.engine.internals.native_engine import IntrinsicError
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.process import Process, ProcessExecutionFailure
@@ -44,6 +48,7 @@ from pants.engine.target import (
     TransitiveTargetsRequest,
 )
 from pants.testutil.rule_runner import QueryRule, RuleRunner, engine_error
+from pants.util.frozendict import FrozenDict
 
 
 @pytest.fixture
@@ -56,6 +61,7 @@ def rule_runner() -> RuleRunner:
             *core_target_type_rules(),
             QueryRule(GeneratedSources, [GenerateFilesFromShellCommandRequest]),
             QueryRule(Process, [AdhocProcessRequest]),
+            QueryRule(Process, [AddExtraSandboxContentsToProcess]),
             QueryRule(Process, [EnvironmentName, ShellCommandProcessFromTargetRequest]),
             QueryRule(RunRequest, [RunShellCommand]),
             QueryRule(SourceFiles, [SourceFilesRequest]),
@@ -646,10 +652,9 @@ def test_shell_command_boot_script_in_build_root(rule_runner: RuleRunner) -> Non
 
     tgt = rule_runner.get_target(Address("", target_name="boot-script-test"))
     res = rule_runner.request(Process, [ShellCommandProcessFromTargetRequest(tgt)])
+    # No `cd` is needed at the build root, so the command is not wrapped in a second `bash -c`.
     assert "bash" in res.argv[0]
-    assert res.argv[1] == "-c"
-    assert "bash -c" in res.argv[2]
-    assert res.argv[2].endswith(shlex.quote("./command.script") + " //:boot-script-test")
+    assert res.argv[1:] == ("-c", "./command.script", "//:boot-script-test")
 
 
 def test_shell_command_extra_env_vars(caplog, rule_runner: RuleRunner) -> None:
@@ -807,6 +812,29 @@ def test_env_vars(rule_runner: RuleRunner) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("env", "expected_path"),
+    [
+        ({}, "/extra/bin"),
+        ({"PATH": "/usr/bin"}, "/extra/bin:/usr/bin"),
+    ],
+)
+def test_extra_contents_path_precedes_process_path(
+    rule_runner: RuleRunner, env: dict[str, str], expected_path: str
+) -> None:
+    process = Process(argv=("true",), description="extra contents", env=env)
+    extras = ExtraSandboxContents(
+        digest=EMPTY_DIGEST,
+        path="/extra/bin",
+        immutable_input_digests=FrozenDict(),
+        append_only_caches=FrozenDict(),
+        extra_env=FrozenDict(),
+    )
+
+    result = rule_runner.request(Process, [AddExtraSandboxContentsToProcess(process, extras)])
+    assert result.env["PATH"] == expected_path
+
+
 _DEFAULT = object()
 
 
@@ -5,10 +5,11 @@ from __future__ import annotations
 import dataclasses
 import logging
 import os
+import re
 import shlex
 from dataclasses import dataclass
 from textwrap import dedent  # noqa: PNT20
-from typing import Iterable, Mapping, TypeVar, Union
+from typing import Mapping, TypeVar, Union
 
 from pants.build_graph.address import Address
 from pants.core.goals.package import BuiltPackage, EnvironmentAwarePackageRequest, PackageFieldSet
@@ -49,9 +50,13 @@ from pants.engine.target import (
     TransitiveTargetsRequest,
 )
 from pants.util.frozendict import FrozenDict
+from pants.util.memo import memoized
 
 logger = logging.getLogger(__name__)
 
+# The same set of "unsafe" characters that `shlex.quote` checks for.
+_find_shell_unsafe = re.compile(r"[^\w@%+=:,./-]", re.ASCII).search
+
 
 @dataclass(frozen=True)
 class AdhocProcessRequest:
@@ -151,16 +156,28 @@ class AddExtraSandboxContentsToProcess:
 async def merge_extra_sandbox_contents(request: MergeExtraSandboxContents) -> ExtraSandboxContents:
     additions = request.additions
 
-    digests = []
-    paths = []
+    # Fast paths which avoid merging digests (and copying mappings) when there is nothing to merge.
+    if not additions:
+        return ExtraSandboxContents(EMPTY_DIGEST, None, FrozenDict(), FrozenDict(), FrozenDict())
+    if len(additions) == 1:
+        addition = additions[0]
+        if all(
+            isinstance(mapping, FrozenDict)
+            for mapping in (
+                addition.immutable_input_digests,
+                addition.append_only_caches,
+                addition.extra_env,
+            )
+        ):
+            return addition
+
+    digests = tuple(addition.digest for addition in additions)
+    paths = [addition.path for addition in additions if addition.path is not None]
     immutable_input_digests: dict[str, Digest] = {}
     append_only_caches: dict[str, str] = {}
     extra_env: dict[str, str] = {}
 
     for addition in additions:
-        digests.append(addition.digest)
-        if addition.path is not None:
-            paths.append(addition.path)
         _safe_update(immutable_input_digests, addition.immutable_input_digests)
         _safe_update(append_only_caches, addition.append_only_caches)
         _safe_update(extra_env, addition.extra_env)
@@ -193,7 +210,7 @@ async def add_extra_contents_to_process(request: AddExtraSandboxContentsToProces
     _safe_update(env, extras.extra_env)
     # need to do `PATH` after `env` in case `extra_env` contains a `PATH`.
     if extras.path:
-        env["PATH"] = extras.path + (":" + env["PATH"]) if "PATH" in env else ""
+        env["PATH"] = ":".join(path for path in (extras.path, env.get("PATH")) if path)
 
     return dataclasses.replace(
         proc,
@@ -218,7 +235,7 @@ async def _resolve_runnable_dependencies(
     addresses = await Get(
         Addresses,
         UnparsedAddressInputs(
-            (dep for dep in deps),
+            deps,
             owning_address=owning,
             description_of_origin=origin,
         ),
@@ -254,8 +271,8 @@ async def _resolve_runnable_dependencies(
             ExtraSandboxContents(
                 digest=runnable.digest,
                 path=None,
-                immutable_input_digests=FrozenDict(runnable.immutable_input_digests or {}),
-                append_only_caches=FrozenDict(runnable.append_only_caches or {}),
+                immutable_input_digests=FrozenDict.frozen(runnable.immutable_input_digests or {}),
+                append_only_caches=FrozenDict.frozen(runnable.append_only_caches or {}),
                 extra_env=FrozenDict(),
             )
         )
@@ -323,7 +340,7 @@ async def resolve_execution_environment(
         Get(
             SourceFiles,
             SourceFilesRequest(
-                sources_fields=[tgt.get(SourcesField) for tgt in all_dependencies],
+                sources_fields=(tgt.get(SourcesField) for tgt in all_dependencies),
                 for_sources_types=(SourcesField, FileSourceField),
                 enable_codegen=True,
             ),
@@ -362,15 +379,18 @@ def _safe_update(d1: dict[K, V], d2: Mapping[K, V]) -> dict[K, V]:
     """Updates `d1` with the values from `d2`, raising an exception if a key exists in both
     dictionaries, but with a different value."""
 
-    for k, v in d2.items():
-        if k in d1 and d1[k] != v:
+    for k in d1.keys() & d2.keys():
+        if d1[k] != d2[k]:
             raise ValueError(f"Key {k} was specified in both dictionaries with different values.")
-        d1[k] = v
+    d1.update(d2)
     return d1
 
 
+# NB: Unbounded, but there is one small entry per distinct runnable dependency, which is no more
+# than the number of targets the engine is already holding in memory.
+@memoized
 def _runnable_dependency_shim(
-    bash: str, args: Iterable[str], extra_env: Mapping[str, str]
+    bash: str, args: tuple[str, ...], extra_env: FrozenDict[str, str]
 ) -> bytes:
     """The binary shim script to be placed in the output directory for the digest."""
 
@@ -438,8 +458,11 @@ async def create_tool_runner(
     dependencies_digest = execution_environment.digest
     runnable_dependencies = execution_environment.runnable_dependencies
 
-    extra_env: dict[str, str] = dict(run_request.extra_env or {})
-    extra_path = extra_env.pop("PATH", None)
+    # `PATH` is merged separately (via `ExtraSandboxContents.path`) from the rest of the env.
+    run_request_env = run_request.extra_env
+    extra_path = run_request_env.get("PATH")
+    if extra_path is not None:
+        run_request_env = FrozenDict((k, v) for k, v in run_request_env.items() if k != "PATH")
 
     extra_sandbox_contents = []
 
@@ -449,7 +472,7 @@ async def create_tool_runner(
             extra_path,
             run_request.immutable_input_digests or FrozenDict(),
             run_request.append_only_caches or FrozenDict(),
-            run_request.extra_env or FrozenDict(),
+            run_request_env,
         )
     )
 
@@ -469,9 +492,9 @@ async def create_tool_runner(
         Get(Digest, MergeDigests((dependencies_digest, run_request.digest))),
     )
 
-    extra_env = dict(merged_extras.extra_env)
-    if merged_extras.path:
-        extra_env["PATH"] = merged_extras.path
+    extra_env = FrozenDict.frozen(merged_extras.extra_env)
+    if merged_extras.path is not None:
+        extra_env = FrozenDict({**extra_env, "PATH": merged_extras.path})
 
     append_only_caches = {
         **merged_extras.append_only_caches,
@@ -481,7 +504,7 @@ async def create_tool_runner(
     return ToolRunner(
         digest=main_digest,
         args=run_request.args + tuple(request.args),
-        extra_env=FrozenDict(extra_env),
+        extra_env=extra_env,
         append_only_caches=FrozenDict(append_only_caches),
         immutable_input_digests=FrozenDict(merged_extras.immutable_input_digests),
     )
@@ -582,11 +605,10 @@ async def prepare_adhoc_process(
 
     if not working_directory or working_directory in input_snapshot.dirs:
         # Needed to ensure that underlying filesystem does not change during run
-        work_dir = EMPTY_DIGEST
+        input_digest = request.input_digest
     else:
         work_dir = await Get(Digest, CreateDigest([Directory(working_directory)]))
-
-    input_digest = await Get(Digest, MergeDigests([request.input_digest, work_dir]))
+        input_digest = await Get(Digest, MergeDigests([request.input_digest, work_dir]))
 
     proc = Process(
         argv=argv,
@@ -606,27 +628,48 @@ async def prepare_adhoc_process(
 
 
 def _output_at_build_root(process: Process, bash: BashBinary) -> Process:
-    working_directory = process.working_directory or ""
+    working_directory = process.working_directory
+    if not working_directory:
+        # Already running (and capturing outputs) at the build root: no `cd` wrapper is needed.
+        return process
 
-    output_directories = process.output_directories
-    output_files = process.output_files
-    if working_directory:
-        output_directories = tuple(os.path.join(working_directory, d) for d in output_directories)
-        output_files = tuple(os.path.join(working_directory, d) for d in output_files)
-
-    cd = f"cd {shlex.quote(working_directory)} && " if working_directory else ""
-    shlexed_argv = " ".join(shlex.quote(arg) for arg in process.argv)
-    new_argv = (bash.path, "-c", f"{cd}{shlexed_argv}")
+    output_directories = _prefix_output_paths(working_directory, process.output_directories)
+    output_files = _prefix_output_paths(working_directory, process.output_files)
 
     return dataclasses.replace(
         process,
-        argv=new_argv,
+        argv=_build_bash_argv(bash.path, working_directory, process.argv),
         working_directory=None,
         output_directories=output_directories,
         output_files=output_files,
     )
 
 
+def _build_bash_argv(
+    bash_path: str, working_directory: str, argv: tuple[str, ...]
+) -> tuple[str, str, str]:
+    """Wrap `argv` in a `bash -c` invocation that first changes into `working_directory`."""
+
+    shlexed_argv = " ".join(map(_shell_quote, argv))
+    return (bash_path, "-c", f"cd {_shell_quote(working_directory)} && {shlexed_argv}")
+
+
+def _prefix_output_paths(working_directory: str, paths: tuple[str, ...]) -> tuple[str, ...]:
+    """Make output `paths` relative to the build root rather than to `working_directory`."""
+
+    if not paths:
+        return paths
+    return tuple(os.path.join(working_directory, path) for path in paths)
+
+
+def _shell_quote(s: str) -> str:
+    """Equivalent to `shlex.quote`, but with a fast path for arguments that need no quoting."""
+
+    if s and _find_shell_unsafe(s) is None:
+        return s
+    return "'" + s.replace("'", "'\"'\"'") + "'"
+
+
 def parse_relative_directory(workdir_in: str, relative_to: Union[Address, str]) -> str:
     """Convert the `workdir` field into something that can be understood by `Process`."""
 
@@ -635,14 +678,15 @@ def parse_relative_directory(workdir_in: str, relative_to: Union[Address, str])
     else:
         reldir = relative_to
 
-    if workdir_in == ".":
-        return reldir
-    elif workdir_in.startswith("./"):
-        return os.path.join(reldir, workdir_in[2:])
-    elif workdir_in.startswith("/"):
+    first = workdir_in[:1]
+    if first == "/":
         return workdir_in[1:]
-    else:
-        return workdir_in
+    elif first == ".":
+        if workdir_in == ".":
+            return reldir
+        elif workdir_in.startswith("./"):
+            return os.path.join(reldir, workdir_in[2:])
+    return workdir_in
 
 
 def _parse_relative_file(file_in: str, relative_to: str) -> str:
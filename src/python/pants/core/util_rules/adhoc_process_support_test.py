@@ -0,0 +1,68 @@
+# Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import shlex
+
+import pytest
+
+from pants.build_graph.address import Address
+from pants.core.util_rules.adhoc_process_support import (
+    _parse_relative_file,
+    _shell_quote,
+    parse_relative_directory,
+)
+
+
+@pytest.mark.parametrize(
+    "workdir_in, relative_to, expected",
+    [
+        (".", "src/project", "src/project"),
+        (".", Address("src/project", target_name="tgt"), "src/project"),
+        ("./sub/dir", "src/project", "src/project/sub/dir"),
+        ("./sub", "", "sub"),
+        ("/", "src/project", ""),
+        ("/other/dir", "src/project", "other/dir"),
+        ("", "src/project", ""),
+        ("other/dir", "src/project", "other/dir"),
+        (".hidden/dir", "src/project", ".hidden/dir"),
+        ("./x", "src/project/", "src/project/x"),
+    ],
+)
+def test_parse_relative_directory(
+    workdir_in: str, relative_to: Address | str, expected: str
+) -> None:
+    assert parse_relative_directory(workdir_in, relative_to) == expected
+
+
+@pytest.mark.parametrize(
+    "file_in, relative_to, expected",
+    [
+        ("out.log", "src/project", "src/project/out.log"),
+        ("logs/out.log", "src/project", "src/project/logs/out.log"),
+        ("out.log", "", "out.log"),
+        ("out.log", "out/", "out/out.log"),
+        ("/logs/out.log", "src/project", "logs/out.log"),
+    ],
+)
+def test_parse_relative_file(file_in: str, relative_to: str, expected: str) -> None:
+    assert _parse_relative_file(file_in, relative_to) == expected
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        "",
+        "plain",
+        "path/to/file.txt",
+        "--flag=value",
+        "with space",
+        "it's",
+        "$HOME",
+        "a'b\"c",
+        "ünïcode",
+    ],
+)
+def test_shell_quote_matches_shlex(arg: str) -> None:
+    assert _shell_quote(arg) == shlex.quote(arg)
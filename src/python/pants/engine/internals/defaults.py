@@ -27,6 +27,7 @@ from pants.engine.target import (
 )
 from pants.engine.unions import UnionMembership
 from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
 
 SetDefaultsValueT = Mapping[str, Any]
 SetDefaultsKeyT = Union[str, Tuple[str, ...]]
@@ -163,10 +164,12 @@ class BuildFileDefaultsParserState:
             else:
                 self.defaults[tgt] = default
 
-    def _target_type_field_types(self, target_type: type[Target]) -> tuple[type[Field], ...]:
-        return (
-            *target_type.class_field_types(self.union_membership),
-            *(target_type.moved_fields if issubclass(target_type, TargetGenerator) else ()),
+    def _target_type_field_types(self, target_type: type[Target]) -> FrozenOrderedSet[type[Field]]:
+        return FrozenOrderedSet(
+            (
+                *target_type.class_field_types(self.union_membership),
+                *(target_type.moved_fields if issubclass(target_type, TargetGenerator) else ()),
+            )
         )
 
     def _process_defaults(
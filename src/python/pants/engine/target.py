@@ -69,7 +69,7 @@ from pants.util.collections import ensure_list, ensure_str_list
 from pants.util.dirutil import fast_relpath
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
-from pants.util.memo import memoized_classproperty, memoized_method, memoized_property
+from pants.util.memo import memoized, memoized_classproperty, memoized_method, memoized_property
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import bullet_list, help_text, pluralize, softwrap
 
@@ -398,15 +398,18 @@ class Target:
 
     @final
     @classmethod
+    @memoized_method
     def _get_field_aliases_to_field_types(
-        cls, field_types: Iterable[type[Field]]
-    ) -> dict[str, type[Field]]:
+        cls, field_types: FrozenOrderedSet[type[Field]]
+    ) -> FrozenDict[str, type[Field]]:
+        # NB: Memoized because this is called for every Target construction, and the registered
+        # field types for a target type rarely change.
         aliases_to_field_types = {}
         for field_type in field_types:
             aliases_to_field_types[field_type.alias] = field_type
             if field_type.deprecated_alias is not None:
                 aliases_to_field_types[field_type.deprecated_alias] = field_type
-        return aliases_to_field_types
+        return FrozenDict(aliases_to_field_types)
 
     @final
     @property
@@ -2052,6 +2055,17 @@ class DictStringToStringSequenceField(Field):
         return FrozenDict(result)
 
 
+@memoized
+def _valid_choices_set(valid_choices: Union[Type[Enum], Tuple[Any, ...]]) -> frozenset[Any]:
+    # NB: Memoized because this is consulted for every constructed field with `valid_choices`,
+    # which are class-level constants.
+    return frozenset(
+        valid_choices
+        if isinstance(valid_choices, tuple)
+        else (choice.value for choice in valid_choices)
+    )
+
+
 def _validate_choices(
     address: Address,
     field_alias: str,
@@ -2059,11 +2073,7 @@ def _validate_choices(
     *,
     valid_choices: Union[Type[Enum], Tuple[Any, ...]],
 ) -> None:
-    _valid_choices = set(
-        valid_choices
-        if isinstance(valid_choices, tuple)
-        else (choice.value for choice in valid_choices)
-    )
+    _valid_choices = _valid_choices_set(valid_choices)
     for choice in values:
         if choice not in _valid_choices:
             raise InvalidFieldChoiceException(